@@ -6,11 +6,40 @@ import re
 import sys
 from pathlib import Path
 
+# ijson lets us stream cells out of the notebook without materializing
+# the whole JSON tree; fall back to json.load when it is not installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Compiled once at module load; strip_ansi_codes runs per output cell
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
 
 def strip_ansi_codes(text: str) -> str:
     """Remove ANSI escape codes from text."""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    if '\x1b' not in text:
+        # Fast path: most outputs contain no escape codes at all
+        return text
+    return _ANSI_RE.sub('', text)
+
+
+def iter_notebook_cells(notebook_file: Path):
+    """Yield cells from a notebook one at a time.
+
+    With ijson available, cells are parsed incrementally from the file
+    so memory stays flat regardless of notebook size; otherwise the
+    whole notebook is loaded with json.load and iterated.
+    """
+    if ijson is not None:
+        with open(notebook_file, 'rb') as f:
+            yield from ijson.items(f, 'cells.item')
+    else:
+        with open(notebook_file, 'r', encoding='utf-8') as f:
+            notebook = json.load(f)
+        yield from notebook.get('cells', [])
 
 
 def convert_notebook_to_markdown(notebook_path: str, output_path: str = None):
@@ -32,69 +61,62 @@ def convert_notebook_to_markdown(notebook_path: str, output_path: str = None):
     else:
         output_path = Path(output_path)
     
-    # Read the notebook
-    with open(notebook_file, 'r', encoding='utf-8') as f:
-        notebook = json.load(f)
-    
-    # Convert to markdown
-    markdown_lines = []
-    
-    for cell in notebook.get('cells', []):
-        cell_type = cell.get('cell_type')
-        source = cell.get('source', [])
-        
-        # Handle source as list or string
-        if isinstance(source, list):
-            content = ''.join(source)
-        else:
-            content = source
-        
-        if cell_type == 'markdown':
-            # Add markdown cell content directly
-            markdown_lines.append(content)
-            markdown_lines.append('\n')
-        
-        elif cell_type == 'code':
-            # Add code cell with syntax highlighting
-            markdown_lines.append('```python\n')
-            markdown_lines.append(content)
-            if not content.endswith('\n'):
-                markdown_lines.append('\n')
-            markdown_lines.append('```\n\n')
-            
-            # Optionally include outputs
-            outputs = cell.get('outputs', [])
-            if outputs:
-                markdown_lines.append('**Output:**\n\n')
-                for output in outputs:
-                    output_type = output.get('output_type')
-                    
-                    if output_type == 'stream':
-                        text = ''.join(output.get('text', []))
-                        text = strip_ansi_codes(text)
-                        markdown_lines.append('```\n')
-                        markdown_lines.append(text)
-                        markdown_lines.append('```\n\n')
-                    
-                    elif output_type in ['execute_result', 'display_data']:
-                        # Handle text/plain output
-                        data = output.get('data', {})
-                        if 'text/plain' in data:
-                            text = ''.join(data['text/plain'])
+    # Convert to markdown, streaming cells out of the notebook and
+    # writing each piece straight to the (buffered) output file - no
+    # intermediate whole-document string is ever built
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        for cell in iter_notebook_cells(notebook_file):
+            cell_type = cell.get('cell_type')
+            source = cell.get('source', [])
+
+            # Handle source as list or string
+            if isinstance(source, list):
+                content = ''.join(source)
+            else:
+                content = source
+
+            if cell_type == 'markdown':
+                # Add markdown cell content directly
+                out.write(content)
+                out.write('\n')
+
+            elif cell_type == 'code':
+                # Add code cell with syntax highlighting
+                out.write('```python\n')
+                out.write(content)
+                if not content.endswith('\n'):
+                    out.write('\n')
+                out.write('```\n\n')
+
+                # Optionally include outputs
+                outputs = cell.get('outputs', [])
+                if outputs:
+                    out.write('**Output:**\n\n')
+                    for output in outputs:
+                        output_type = output.get('output_type')
+
+                        if output_type == 'stream':
+                            text = ''.join(output.get('text', []))
                             text = strip_ansi_codes(text)
-                            markdown_lines.append('```\n')
-                            markdown_lines.append(text)
-                            markdown_lines.append('\n```\n\n')
-                    
-                    elif output_type == 'error':
-                        markdown_lines.append('```\n')
-                        markdown_lines.append('\n'.join(output.get('traceback', [])))
-                        markdown_lines.append('\n```\n\n')
-    
-    # Write the markdown file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(''.join(markdown_lines))
-    
+                            out.write('```\n')
+                            out.write(text)
+                            out.write('```\n\n')
+
+                        elif output_type in ['execute_result', 'display_data']:
+                            # Handle text/plain output
+                            data = output.get('data', {})
+                            if 'text/plain' in data:
+                                text = ''.join(data['text/plain'])
+                                text = strip_ansi_codes(text)
+                                out.write('```\n')
+                                out.write(text)
+                                out.write('\n```\n\n')
+
+                        elif output_type == 'error':
+                            out.write('```\n')
+                            out.write('\n'.join(output.get('traceback', [])))
+                            out.write('\n```\n\n')
+
     print(f"✓ Converted {notebook_path} to {output_path}")
 
 
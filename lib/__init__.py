@@ -6,15 +6,52 @@ from .env import get_env_key, get_base_url
 from .task import (
     create_task,
     get_task_status,
+    get_task_status_only,
+    get_tasks_status,
     poll_task_until_complete,
+    wait_for_all_tasks,
     extract_task_output_text
 )
+from .async_task import (
+    get_async_client,
+    get_task_status_async,
+    poll_task_until_complete_async,
+    wait_for_all_tasks_async
+)
+from .client import ManusClient
+from .config import Config, config
+from .files import (
+    create_file_record,
+    upload_file,
+    upload_files
+)
+from .webhook import (
+    register_webhook,
+    delete_webhook,
+    wait_for_task_via_webhook
+)
 
 __all__ = [
     "get_env_key",
     "get_base_url",
     "create_task",
     "get_task_status",
+    "get_task_status_only",
+    "get_tasks_status",
     "poll_task_until_complete",
+    "wait_for_all_tasks",
     "extract_task_output_text",
+    "get_async_client",
+    "get_task_status_async",
+    "poll_task_until_complete_async",
+    "wait_for_all_tasks_async",
+    "create_file_record",
+    "upload_file",
+    "upload_files",
+    "register_webhook",
+    "delete_webhook",
+    "wait_for_task_via_webhook",
+    "ManusClient",
+    "Config",
+    "config",
 ]
@@ -0,0 +1,178 @@
+"""
+Asyncio-based task polling for Manus API, for watching many tasks at once.
+"""
+
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+
+
+__all__ = [
+    "get_async_client",
+    "get_task_status_async",
+    "poll_task_until_complete_async",
+    "wait_for_all_tasks_async",
+]
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """
+    Create an httpx.AsyncClient configured for Manus API polling.
+
+    The client shares one connection pool across all requests made with
+    it, and negotiates HTTP/2 so concurrent polls ride a single TCP
+    connection as independent streams: one TLS session, HPACK-compressed
+    headers, and no head-of-line blocking between tasks.
+
+    Returns:
+        httpx.AsyncClient: A client to pass to the async polling functions
+    """
+    # Deferred so importing the library stays fast; Python caches the
+    # module, so repeated calls cost a dict lookup
+    import httpx
+
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=100),
+        timeout=30.0
+    )
+
+
+async def get_task_status_async(
+    client: "httpx.AsyncClient",
+    api_key: str,
+    task_id: str,
+    base_url: str = "https://api.manus.ai/v1"
+) -> Dict[str, Any]:
+    """
+    Async variant of get_task_status.
+
+    Args:
+        client: A shared httpx.AsyncClient (see get_async_client)
+        api_key: The Manus API key
+        task_id: The task ID to query
+        base_url: The base URL for the Manus API
+
+    Returns:
+        dict: The full task object containing status, output, metadata, etc.
+
+    Raises:
+        httpx.HTTPStatusError: If the API request fails
+    """
+    response = await client.get(
+        f"{base_url}/tasks/{task_id}",
+        headers={"API_KEY": api_key}
+    )
+    response.raise_for_status()
+
+    return response.json()
+
+
+async def poll_task_until_complete_async(
+    client: "httpx.AsyncClient",
+    api_key: str,
+    task_id: str,
+    base_url: str = "https://api.manus.ai/v1",
+    polling_interval: float = 1.0,
+    backoff_base: float = 1.3,
+    max_interval: float = 60.0,
+    max_attempts: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Async variant of poll_task_until_complete.
+
+    Awaiting instead of sleeping means one event loop can watch hundreds
+    of tasks concurrently: each waiter costs a coroutine rather than a
+    thread, and all their requests share the client's connection pool.
+
+    Args:
+        client: A shared httpx.AsyncClient (see get_async_client)
+        api_key: The Manus API key
+        task_id: The task ID to poll
+        base_url: The base URL for the Manus API
+        polling_interval: Initial time in seconds between polls (default: 1.0)
+        backoff_base: Multiplier applied to the interval after each poll (default: 1.3)
+        max_interval: Upper bound in seconds for the polling interval (default: 60.0)
+        max_attempts: Maximum number of polling attempts (None for unlimited)
+
+    Returns:
+        dict: The final task object after completion
+
+    Raises:
+        httpx.HTTPStatusError: If the API request fails
+        TimeoutError: If max_attempts is reached before task completes
+    """
+    attempts = 0
+    interval = polling_interval
+
+    while True:
+        task = await get_task_status_async(client, api_key, task_id, base_url)
+
+        if task["status"] != "running":
+            return task
+
+        attempts += 1
+        if max_attempts and attempts >= max_attempts:
+            raise TimeoutError(
+                f"Task {task_id} did not complete after {max_attempts} attempts"
+            )
+
+        # Jitter each sleep so a fan-out of waiters does not poll in
+        # lockstep when many tasks complete around the same time
+        await asyncio.sleep(random.uniform(0.5, 1.5) * interval)
+        interval = min(max_interval, interval * backoff_base)
+
+
+def wait_for_all_tasks_async(
+    api_key: str,
+    task_ids: List[str],
+    base_url: str = "https://api.manus.ai/v1",
+    polling_interval: float = 1.0,
+    backoff_base: float = 1.3,
+    max_interval: float = 60.0
+) -> List[Dict[str, Any]]:
+    """
+    Wait for many tasks concurrently and return their final task objects.
+
+    Sync convenience wrapper: fans out one poll_task_until_complete_async
+    coroutine per task over a shared client and runs them to completion
+    with asyncio.run. When called from inside a running event loop (e.g.
+    a Jupyter notebook, where ipykernel owns the loop) the coroutines
+    run on their own loop in a worker thread, since asyncio.run cannot
+    nest; async callers can await poll_task_until_complete_async
+    directly instead.
+
+    Args:
+        api_key: The Manus API key
+        task_ids: The task IDs to wait for
+        base_url: The base URL for the Manus API
+        polling_interval: Initial time in seconds between polls (default: 1.0)
+        backoff_base: Multiplier applied to the interval after each poll (default: 1.3)
+        max_interval: Upper bound in seconds for the polling interval (default: 60.0)
+
+    Returns:
+        list: The final task objects, in the same order as task_ids
+    """
+    async def _wait_all() -> List[Dict[str, Any]]:
+        async with get_async_client() as client:
+            return list(await asyncio.gather(*(
+                poll_task_until_complete_async(
+                    client, api_key, task_id, base_url,
+                    polling_interval, backoff_base, max_interval
+                )
+                for task_id in task_ids
+            )))
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_wait_all())
+
+    # Already inside an event loop: hand the coroutine to a fresh loop
+    # on a worker thread and block this (synchronous) caller on it
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, _wait_all()).result()
@@ -0,0 +1,108 @@
+"""
+Typed client facade over the Manus API helper functions.
+"""
+
+from typing import Optional, Dict, Any, List
+
+from .env import get_env_key, get_base_url
+from .files import upload_file
+from .task import (
+    Attachment,
+    create_task,
+    get_task_status,
+    get_task_status_only,
+    get_tasks_status,
+    poll_task_until_complete,
+    wait_for_all_tasks,
+)
+from .webhook import register_webhook, delete_webhook, wait_for_task_via_webhook
+
+
+__all__ = ["ManusClient"]
+
+
+class ManusClient:
+    """
+    A client that binds the API key and base URL once so call sites do
+    not thread them through every request.
+
+    All methods delegate to the module-level functions, so they share
+    the same pooled session, cached headers, and request coalescing.
+
+    Example:
+        client = ManusClient()
+        task = client.create_task("Summarize this document")
+        result = client.poll_task_until_complete(task["task_id"])
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None
+    ):
+        """
+        Args:
+            api_key: The Manus API key (defaults to the validated key
+                     from the environment via get_env_key)
+            base_url: The base URL for the Manus API
+        """
+        self.api_key = api_key or get_env_key()
+        self.base_url = base_url or get_base_url()
+
+    def create_task(
+        self,
+        prompt: str,
+        agent_profile: str = "manus-1.5",
+        task_mode: Optional[str] = None,
+        attachments: Optional[List[Attachment]] = None,
+        connectors: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Create a new Manus task. See task.create_task."""
+        return create_task(
+            self.api_key, prompt, agent_profile, self.base_url,
+            task_mode, attachments, connectors
+        )
+
+    def get_task_status(self, task_id: str) -> Dict[str, Any]:
+        """Get the full task object. See task.get_task_status."""
+        return get_task_status(self.api_key, task_id, self.base_url)
+
+    def get_task_status_only(self, task_id: str) -> str:
+        """Get just the task status string. See task.get_task_status_only."""
+        return get_task_status_only(self.api_key, task_id, self.base_url)
+
+    def get_tasks_status(self, task_ids: List[str]) -> Dict[str, str]:
+        """Get statuses for many tasks in one batch. See task.get_tasks_status."""
+        return get_tasks_status(self.api_key, task_ids, self.base_url)
+
+    def poll_task_until_complete(self, task_id: str, **kwargs) -> Dict[str, Any]:
+        """Poll a task until it finishes. See task.poll_task_until_complete."""
+        return poll_task_until_complete(
+            self.api_key, task_id, self.base_url, **kwargs
+        )
+
+    def wait_for_all_tasks(self, task_ids: List[str], **kwargs) -> Dict[str, str]:
+        """Wait for many tasks with batched polling. See task.wait_for_all_tasks."""
+        return wait_for_all_tasks(self.api_key, task_ids, self.base_url, **kwargs)
+
+    def upload_file(
+        self,
+        file_path: str,
+        filename: Optional[str] = None
+    ) -> str:
+        """Upload a local file and return its file_id. See files.upload_file."""
+        return upload_file(self.api_key, file_path, filename, self.base_url)
+
+    def register_webhook(self, webhook_url: str) -> str:
+        """Register a webhook URL. See webhook.register_webhook."""
+        return register_webhook(self.api_key, webhook_url, self.base_url)
+
+    def delete_webhook(self, webhook_id: str) -> None:
+        """Delete a registered webhook. See webhook.delete_webhook."""
+        delete_webhook(self.api_key, webhook_id, self.base_url)
+
+    def wait_for_task_via_webhook(self, task_id: str, **kwargs) -> Dict[str, Any]:
+        """Wait for a task via webhook. See webhook.wait_for_task_via_webhook."""
+        return wait_for_task_via_webhook(
+            self.api_key, task_id, base_url=self.base_url, **kwargs
+        )
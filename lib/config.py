@@ -0,0 +1,52 @@
+"""
+Static configuration for Manus API scripts.
+"""
+
+import os
+from typing import FrozenSet, NamedTuple
+
+
+__all__ = ["Config", "config"]
+
+
+class Config(NamedTuple):
+    """
+    Immutable configuration snapshot.
+
+    A NamedTuple keeps instances frozen and __dict__-free, and attribute
+    access compiles down to a C-level tuple index - cheaper than the
+    normal instance-dict/MRO walk for code that reads config repeatedly.
+    """
+
+    MANUS_API_KEY: str
+    BASE_URL: str = "https://api.manus.ai/v1"
+    MAX_FILE_SIZE: int = 50 * 1024 * 1024  # 50 MB
+    # frozenset so "ext in config.ALLOWED_FILE_TYPES" is an O(1) hash
+    # lookup rather than a linear scan, however many checks callers do
+    ALLOWED_FILE_TYPES: FrozenSet[str] = frozenset({
+        ".txt", ".pdf", ".docx", ".csv", ".xlsx", ".md", ".json", ".xml"
+    })
+
+    def validate(self) -> None:
+        """
+        Check that the required settings are present.
+
+        Raises:
+            ValueError: If MANUS_API_KEY is not set
+        """
+        if not self.MANUS_API_KEY:
+            raise ValueError("⚠️  Please set your MANUS_API_KEY in the .env file at the repository root")
+
+
+def _load_config() -> Config:
+    """Build the snapshot, pulling the key from the repo's .env file."""
+    # Deferred so importing the library stays fast; load_dotenv fills the
+    # environment from .env, matching how get_env_key finds the key
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return Config(MANUS_API_KEY=os.getenv("MANUS_API_KEY", ""))
+
+
+# Singleton snapshot taken at import time; callers read config.X
+config = _load_config()
@@ -3,50 +3,82 @@ Environment configuration and API key validation for Manus API.
 """
 
 import os
-import requests
-from dotenv import load_dotenv
+import functools
 
+from .session import get_session, bare_headers
 
-def get_env_key():
+
+@functools.lru_cache(maxsize=4)
+def _validate_api_key(api_key):
+    """
+    Validate an API key with a test request to the files endpoint.
+
+    Cached per key: the first call in a process pays the network round
+    trip, subsequent calls return immediately. Failed validations are
+    not cached (lru_cache does not memoize exceptions), so a key that
+    was rejected is re-checked on the next call.
+
+    Raises:
+        ValueError: If the API key is invalid
+    """
+    # Deferred so importing the library stays fast; Python caches the
+    # modules, so repeated calls cost a dict lookup
+    import requests
+
+    try:
+        url = "https://api.manus.ai/v1/files"
+        response = get_session().get(url, headers=bare_headers(api_key))
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 401:
+            raise ValueError("⚠️  Invalid API key. Please check your MANUS_API_KEY in the .env file")
+        else:
+            raise ValueError(f"⚠️  API key validation failed: {str(e)}")
+    except Exception as e:
+        raise ValueError(f"⚠️  Failed to validate API key: {str(e)}")
+
+
+def get_env_key(force=False):
     """
     Load and validate the Manus API key from environment variables.
-    
+
     This function:
     1. Loads environment variables from .env file
     2. Retrieves the MANUS_API_KEY
     3. Validates the key by making a test request to the files endpoint
-    
+
+    The network validation runs once per key per process; repeated
+    calls (e.g. at the top of every notebook cell) skip the round trip.
+
+    Args:
+        force: Re-validate against the API even if this key already
+               passed validation in this process (default: False)
+
     Returns:
         str: The validated Manus API key
-        
+
     Raises:
         ValueError: If the API key is not set or invalid
     """
+    from dotenv import load_dotenv
+
     # Load API key from .env file
     load_dotenv()
-    
+
     # Get the API key
     api_key = os.getenv("MANUS_API_KEY")
-    
+
     # Validate API key is loaded
     if not api_key:
         raise ValueError("⚠️  Please set your MANUS_API_KEY in the .env file at the repository root")
-    
-    # Test the API key with the files endpoint
-    try:
-        url = "https://api.manus.ai/v1/files"
-        response = requests.get(url, headers={"API_KEY": api_key})
-        response.raise_for_status()
-        
-        # If we get here, the API key is valid
-        return api_key
-    except requests.exceptions.HTTPError as e:
-        if e.response.status_code == 401:
-            raise ValueError("⚠️  Invalid API key. Please check your MANUS_API_KEY in the .env file")
-        else:
-            raise ValueError(f"⚠️  API key validation failed: {str(e)}")
-    except Exception as e:
-        raise ValueError(f"⚠️  Failed to validate API key: {str(e)}")
+
+    if force:
+        _validate_api_key.cache_clear()
+
+    # Test the API key with the files endpoint (cached per key)
+    _validate_api_key(api_key)
+
+    return api_key
 
 
 def get_base_url():
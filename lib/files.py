@@ -0,0 +1,162 @@
+"""
+File upload utilities for Manus API.
+"""
+
+import os
+import sys
+import mmap
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List
+
+from .session import get_session, json_headers, json_loads, json_dumps
+
+
+# Endpoint path template, precomputed once at module load
+_FILES_URL_TMPL = "{}/files"
+
+
+__all__ = [
+    "create_file_record",
+    "upload_file",
+    "upload_files",
+]
+
+
+def create_file_record(
+    api_key: str,
+    filename: str,
+    base_url: str = "https://api.manus.ai/v1"
+) -> Dict[str, Any]:
+    """
+    Create a file record and get a presigned upload URL.
+
+    Args:
+        api_key: The Manus API key
+        filename: The filename to register
+        base_url: The base URL for the Manus API
+
+    Returns:
+        dict: The file record containing id and upload_url
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    response = get_session().post(
+        _FILES_URL_TMPL.format(base_url),
+        headers=json_headers(api_key),
+        data=json_dumps({"filename": filename})
+    )
+    response.raise_for_status()
+
+    return json_loads(response.content)
+
+
+def upload_file(
+    api_key: str,
+    file_path: str,
+    filename: Optional[str] = None,
+    base_url: str = "https://api.manus.ai/v1"
+) -> str:
+    """
+    Upload a local file to the Manus workspace and return its file_id.
+
+    This performs the standard two-step upload: create a file record to
+    get a presigned URL, then PUT the file content to that URL. The file
+    object is passed directly to the PUT so requests streams it in
+    chunks - peak memory stays constant regardless of file size, and the
+    upload starts before the whole file has been read from disk.
+
+    Args:
+        api_key: The Manus API key
+        file_path: Path to the local file to upload
+        filename: Filename to register (defaults to the basename of file_path)
+        base_url: The base URL for the Manus API
+
+    Returns:
+        str: The file_id to use as a task attachment
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    if filename is None:
+        filename = os.path.basename(file_path)
+
+    # Step 1: Create a file record to get a presigned upload URL. The
+    # POST only needs the filename while the local prep only needs the
+    # path, so run the record creation in the background and do the
+    # disk-side work during its round trip.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        record_future = executor.submit(
+            create_file_record, api_key, filename, base_url
+        )
+
+        content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        file_size = os.path.getsize(file_path)
+
+        file_record = record_future.result()
+
+    file_id = file_record["id"]
+    upload_url = file_record["upload_url"]
+
+    # Step 2: Send the file content to the presigned URL. On POSIX we
+    # memory-map the file so the body is served straight from the page
+    # cache instead of being copied through read() buffers first; the
+    # plain file object remains the fallback (Windows, empty files).
+    # An explicit Content-Length avoids chunked transfer encoding.
+    headers = {
+        "Content-Type": content_type,
+        "Content-Length": str(file_size)
+    }
+
+    with open(file_path, "rb") as f:
+        if file_size > 0 and sys.platform != "win32":
+            body = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            body = f
+
+        try:
+            upload_response = get_session().put(
+                upload_url,
+                data=body,
+                headers=headers
+            )
+            upload_response.raise_for_status()
+        finally:
+            if body is not f:
+                body.close()
+
+    return file_id
+
+
+def upload_files(
+    api_key: str,
+    file_paths: List[str],
+    base_url: str = "https://api.manus.ai/v1",
+    max_workers: int = 8
+) -> List[str]:
+    """
+    Upload several local files concurrently and return their file_ids.
+
+    The uploads are independent HTTP round trips, so running them on a
+    thread pool turns N sequential RTTs into roughly N / max_workers.
+    The shared session's connection pool is sized to keep the workers
+    from serializing on connections.
+
+    Args:
+        api_key: The Manus API key
+        file_paths: Paths of the local files to upload
+        base_url: The base URL for the Manus API
+        max_workers: Max concurrent uploads (default: 8)
+
+    Returns:
+        list: The file_ids, in the same order as file_paths
+
+    Raises:
+        requests.exceptions.HTTPError: If any upload fails
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda path: upload_file(api_key, path, base_url=base_url),
+            file_paths
+        ))
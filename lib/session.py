@@ -0,0 +1,128 @@
+"""
+Shared HTTP session for Manus API calls.
+"""
+
+import functools
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
+
+
+__all__ = ["get_session", "json_headers", "bare_headers", "json_loads", "json_dumps"]
+
+
+# Prefer orjson for JSON encode/decode in the polling hot path - its C
+# parser is several times faster than stdlib json. Fall back silently
+# when it is not installed.
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON bytes with orjson."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with orjson."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON bytes with the stdlib json module."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize obj to JSON bytes with the stdlib json module."""
+        return json.dumps(obj).encode("utf-8")
+
+
+# A single process-wide session so every API call reuses pooled TCP/TLS
+# connections instead of paying a fresh handshake per request. The
+# mounted adapter also retries transient server errors with backoff.
+# Built lazily so importing the library does not pay the requests/
+# urllib3 import cost on paths that never make an HTTP call.
+_session: Optional["requests.Session"] = None
+
+
+def get_session() -> "requests.Session":
+    """
+    Get the shared requests.Session used for all Manus API calls.
+
+    The session (and the requests import itself) is created on first
+    use, keeping library import fast for code that exits early.
+
+    Returns:
+        requests.Session: The shared, connection-pooled session
+    """
+    global _session
+
+    if _session is None:
+        import ssl
+
+        import certifi
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Parse the CA bundle once and share the resulting SSL context
+        # across every pooled connection, instead of letting urllib3
+        # rebuild the cert store per connection
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+
+        class _SSLContextAdapter(HTTPAdapter):
+            """HTTPAdapter that reuses one preloaded SSL context."""
+
+            def init_poolmanager(self, *args, **kwargs):
+                kwargs["ssl_context"] = ssl_context
+                return super().init_poolmanager(*args, **kwargs)
+
+        _session = requests.Session()
+        # pool_maxsize bounds concurrent connections per host; sized so
+        # thread-pool fan-outs (batch uploads, parallel waits) never
+        # serialize on the connection pool
+        adapter = _SSLContextAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        )
+        _session.mount("https://", adapter)
+        _session.mount("http://", adapter)
+
+    return _session
+
+
+@functools.lru_cache(maxsize=4)
+def json_headers(api_key: str) -> Dict[str, str]:
+    """
+    Get the cached headers dict for JSON-body API requests.
+
+    Built once per api_key so hot loops pass the same dict by reference
+    instead of allocating a fresh one on every call.
+
+    Args:
+        api_key: The Manus API key
+
+    Returns:
+        dict: Headers with API_KEY and Content-Type set
+    """
+    return {"API_KEY": api_key, "Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=4)
+def bare_headers(api_key: str) -> Dict[str, str]:
+    """
+    Get the cached headers dict for body-less API requests.
+
+    Args:
+        api_key: The Manus API key
+
+    Returns:
+        dict: Headers with only API_KEY set
+    """
+    return {"API_KEY": api_key}
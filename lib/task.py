@@ -2,19 +2,38 @@
 Task creation and polling utilities for Manus API.
 """
 
+import os
 import time
-import requests
-from typing import Optional, Dict, Any, List, TypedDict, Union
+import random
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Callable, List, TypedDict, Union
+
+from .session import get_session, json_headers, bare_headers, json_loads, json_dumps
+
+
+logger = logging.getLogger(__name__)
+
+
+# Endpoint path templates, precomputed once so call sites do a single
+# str.format instead of rebuilding f-strings in the polling loop
+_TASKS_URL_TMPL = "{}/tasks"
+_TASK_URL_TMPL = "{}/tasks/{}"
+_TASKS_STATUS_URL_TMPL = "{}/tasks/status"
 
 
 __all__ = [
     "FileIDAttachment",
-    "URLAttachment", 
+    "URLAttachment",
     "Base64Attachment",
     "Attachment",
     "create_task",
     "get_task_status",
+    "get_task_status_only",
+    "get_tasks_status",
     "poll_task_until_complete",
+    "wait_for_all_tasks",
     "extract_task_output_text"
 ]
 
@@ -70,10 +89,7 @@ def create_task(
     Raises:
         requests.exceptions.HTTPError: If the API request fails
     """
-    headers = {
-        "API_KEY": api_key,
-        "Content-Type": "application/json"
-    }
+    headers = json_headers(api_key)
     
     data = {
         "prompt": prompt,
@@ -88,16 +104,23 @@ def create_task(
     if connectors:
         data["connectors"] = connectors
     
-    response = requests.post(
-        f"{base_url}/tasks",
+    response = get_session().post(
+        _TASKS_URL_TMPL.format(base_url),
         headers=headers,
-        json=data
+        data=json_dumps(data)
     )
-    print(response.text)
+    # Guarded so the body is not decoded to str unless debug logging is on
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("create_task response: %s", response.text)
     response.raise_for_status()
 
-    
-    return response.json()
+    return json_loads(response.content)
+
+
+# In-flight status requests keyed by task_id, so concurrent waiters on
+# the same task share one request instead of each polling the API
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
 
 
 def get_task_status(
@@ -107,7 +130,12 @@ def get_task_status(
 ) -> Dict[str, Any]:
     """
     Get the current status and details of a task.
-    
+
+    Concurrent callers asking about the same task are coalesced: only
+    one request is in flight per task_id at a time, and every waiter
+    receives its result. This bounds the request rate no matter how
+    many threads wait on the same task.
+
     Args:
         api_key: The Manus API key
         task_id: The task ID to query
@@ -119,69 +147,327 @@ def get_task_status(
     Raises:
         requests.exceptions.HTTPError: If the API request fails
     """
-    url = f"{base_url}/tasks/{task_id}"
-    headers = {"API_KEY": api_key}
-    
-    response = requests.get(url, headers=headers)
+    with _in_flight_lock:
+        future = _in_flight.get(task_id)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _in_flight[task_id] = future
+
+    if not is_owner:
+        # Another thread is already fetching this task - share its result
+        return future.result()
+
+    try:
+        url = _TASK_URL_TMPL.format(base_url, task_id)
+
+        response = get_session().get(url, headers=bare_headers(api_key))
+        response.raise_for_status()
+
+        task = json_loads(response.content)
+        future.set_result(task)
+        return task
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _in_flight_lock:
+            _in_flight.pop(task_id, None)
+
+
+# Last seen ETag and status per task, used by get_task_status_only to
+# turn unchanged polls into cheap 304 responses
+_etag_cache: Dict[str, str] = {}
+_status_cache: Dict[str, str] = {}
+
+
+def get_task_status_only(
+    api_key: str,
+    task_id: str,
+    base_url: str = "https://api.manus.ai/v1"
+) -> str:
+    """
+    Get just the status string of a task, as cheaply as possible.
+
+    Unlike get_task_status, this does not need the full task body: it
+    sends the last seen ETag as If-None-Match, so when nothing has
+    changed the server can answer 304 and we skip both the response body
+    and the JSON parse. Useful in polling loops that only branch on
+    status.
+
+    Args:
+        api_key: The Manus API key
+        task_id: The task ID to query
+        base_url: The base URL for the Manus API
+
+    Returns:
+        str: The task status (e.g. "running", "completed")
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    url = _TASK_URL_TMPL.format(base_url, task_id)
+
+    etag = _etag_cache.get(task_id)
+    if etag:
+        # Copy the cached dict since this request adds a validator header
+        headers = dict(bare_headers(api_key))
+        headers["If-None-Match"] = etag
+    else:
+        headers = bare_headers(api_key)
+
+    response = get_session().get(url, headers=headers)
+
+    if response.status_code == 304:
+        # Nothing changed since the last poll - reuse the cached status
+        return _status_cache[task_id]
+
     response.raise_for_status()
-    
-    return response.json()
+
+    status = json_loads(response.content)["status"]
+    new_etag = response.headers.get("ETag")
+    if new_etag:
+        _etag_cache[task_id] = new_etag
+        _status_cache[task_id] = status
+
+    return status
+
+
+# Max task IDs per batched status request
+_STATUS_BATCH_SIZE = 100
+
+
+def get_tasks_status(
+    api_key: str,
+    task_ids: List[str],
+    base_url: str = "https://api.manus.ai/v1"
+) -> Dict[str, str]:
+    """
+    Get the statuses of many tasks in one round trip.
+
+    Instead of issuing one GET per task, this POSTs the IDs to the
+    batched status endpoint (in chunks of 100) so watching N tasks costs
+    O(N / 100) requests per tick rather than N.
+
+    Args:
+        api_key: The Manus API key
+        task_ids: The task IDs to query
+        base_url: The base URL for the Manus API
+
+    Returns:
+        dict: Mapping of task_id to status string
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    headers = json_headers(api_key)
+
+    statuses: Dict[str, str] = {}
+
+    for start in range(0, len(task_ids), _STATUS_BATCH_SIZE):
+        chunk = task_ids[start:start + _STATUS_BATCH_SIZE]
+        response = get_session().post(
+            _TASKS_STATUS_URL_TMPL.format(base_url),
+            headers=headers,
+            data=json_dumps({"ids": chunk})
+        )
+        response.raise_for_status()
+        statuses.update(json_loads(response.content))
+
+    return statuses
+
+
+def wait_for_all_tasks(
+    api_key: str,
+    task_ids: List[str],
+    base_url: str = "https://api.manus.ai/v1",
+    polling_interval: float = 1.0,
+    backoff_base: float = 1.3,
+    max_interval: float = 60.0,
+    verbose: bool = True
+) -> Dict[str, str]:
+    """
+    Wait for a set of tasks to finish, polling them as a batch.
+
+    Uses get_tasks_status so each tick is a single request regardless of
+    how many tasks are still running, with the same exponential backoff
+    schedule as poll_task_until_complete. Completed tasks drop out of
+    the working set as they finish.
+
+    Args:
+        api_key: The Manus API key
+        task_ids: The task IDs to wait for
+        base_url: The base URL for the Manus API
+        polling_interval: Initial time in seconds between polls (default: 1.0)
+        backoff_base: Multiplier applied to the interval after each poll (default: 1.3)
+        max_interval: Upper bound in seconds for the polling interval (default: 60.0)
+        verbose: Whether to print status updates (default: True)
+
+    Returns:
+        dict: Mapping of task_id to its final status
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    pending = list(task_ids)
+    final_statuses: Dict[str, str] = {}
+    interval = polling_interval
+
+    while pending:
+        statuses = get_tasks_status(api_key, pending, base_url)
+
+        for task_id, status in statuses.items():
+            if status != "running":
+                final_statuses[task_id] = status
+                pending.remove(task_id)
+                if verbose:
+                    print(f"✓ Task {task_id} is now {status}")
+
+        if not pending:
+            break
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%d task(s) still running", len(pending))
+        if verbose:
+            print(f"⏳ {len(pending)} task(s) still running...")
+
+        time.sleep(random.uniform(0.5, 1.5) * interval)
+        interval = min(max_interval, interval * backoff_base)
+
+    return final_statuses
+
+
+def _print_progress(status: str, attempts: int, task_url: str) -> None:
+    """Default progress reporter matching the old verbose print output."""
+    if status != "running":
+        print(f"✓ Task is now {status}")
+    else:
+        print(
+            f"⏳ Task still running... (attempt {attempts}, "
+            f"check progress at {task_url})"
+        )
 
 
 def poll_task_until_complete(
     api_key: str,
     task_id: str,
     base_url: str = "https://api.manus.ai/v1",
-    polling_interval: int = 10,
+    polling_interval: float = 1.0,
+    backoff_base: float = 1.3,
+    max_interval: float = 60.0,
     max_attempts: Optional[int] = None,
-    verbose: bool = True
+    initial_probe_delay: float = 0.2,
+    verbose: bool = True,
+    progress_callback: Optional[Callable[[str, int, str], None]] = None,
+    should_continue: Optional[Callable[[], bool]] = None,
+    stop_when_orphaned: bool = False
 ) -> Dict[str, Any]:
     """
     Poll a task until it completes (status != "running").
-    
+
+    Uses exponential backoff between polls: the wait starts at
+    polling_interval seconds and grows by backoff_base after each check,
+    capped at max_interval. This keeps short tasks responsive while
+    avoiding a constant stream of requests for long-running ones.
+
+    The first check happens after a short initial_probe_delay so tasks
+    that finish almost immediately are caught without waiting a full
+    interval, and each sleep is multiplied by a random factor in
+    [0.5, 1.5) (full jitter) so many clients polling the same task
+    lifecycle do not hit the server in lockstep.
+
     Args:
         api_key: The Manus API key
         task_id: The task ID to poll
         base_url: The base URL for the Manus API
-        polling_interval: Time in seconds between polling attempts (default: 10)
+        polling_interval: Initial time in seconds between polling attempts (default: 1.0)
+        backoff_base: Multiplier applied to the interval after each poll (default: 1.3)
+        max_interval: Upper bound in seconds for the polling interval (default: 60.0)
         max_attempts: Maximum number of polling attempts (None for unlimited)
+        initial_probe_delay: Seconds to wait before the first status check (default: 0.2)
         verbose: Whether to print status updates (default: True)
-        
+        progress_callback: Called as (status, attempts, task_url) after
+                           each poll; overrides the default print-based
+                           reporting when provided
+        should_continue: Optional liveness predicate evaluated each tick;
+                         polling stops (returning the last task object)
+                         as soon as it returns False, so callers can
+                         stop burning API quota when no one is watching
+        stop_when_orphaned: Stop polling if the parent process has died
+                            (Unix only; detected via os.getppid() == 1)
+
     Returns:
-        dict: The final task object after completion
-        
+        dict: The final task object after completion (or the last seen
+              task object if polling was stopped by should_continue or
+              stop_when_orphaned)
+
     Raises:
         requests.exceptions.HTTPError: If the API request fails
         TimeoutError: If max_attempts is reached before task completes
     """
+    # CLI callers get the old print behaviour via the default callback;
+    # library callers pass their own or set verbose=False to keep the
+    # loop free of stdout writes entirely
+    if progress_callback is None and verbose:
+        progress_callback = _print_progress
+
     attempts = 0
-    
+    interval = polling_interval
+
+    # Give the task a moment to register before the first probe
+    time.sleep(initial_probe_delay)
+
+    import requests
+
     while True:
-        task = get_task_status(api_key, task_id, base_url)
+        try:
+            task = get_task_status(api_key, task_id, base_url)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            # Transient network error: count it like any other attempt so
+            # max_attempts still bounds the call, and keep backing off so
+            # an outage is not hammered at the minimum interval
+            attempts += 1
+            if max_attempts and attempts >= max_attempts:
+                raise
+            time.sleep(random.uniform(0.5, 1.5) * interval)
+            interval = min(max_interval, interval * backoff_base)
+            continue
         status = task["status"]
         task_url = task.get("metadata", {}).get("task_url", "")
-        
+
         # Check if task is no longer running
         if status != "running":
-            if verbose:
-                print(f"✓ Task {task_id} is now {status}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("task %s is now %s", task_id, status)
+            if progress_callback:
+                progress_callback(status, attempts, task_url)
             return task
-        
+
         # Check max attempts
         attempts += 1
         if max_attempts and attempts >= max_attempts:
             raise TimeoutError(
                 f"Task {task_id} did not complete after {max_attempts} attempts"
             )
-        
-        # Print status and wait
-        if verbose:
-            print(
-                f"⏳ Task still running... (attempt {attempts}, "
-                f"check progress at {task_url})"
+
+        # Stop polling when nobody is left to consume the result
+        if should_continue is not None and not should_continue():
+            logger.debug("task %s: should_continue is False, stopping poll", task_id)
+            return task
+        if stop_when_orphaned and os.getppid() == 1:
+            logger.debug("task %s: parent process died, stopping poll", task_id)
+            return task
+
+        # Report status and wait, backing off for the next attempt
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "task %s still running (attempt %d)", task_id, attempts
             )
-        
-        time.sleep(polling_interval)
+        if progress_callback:
+            progress_callback(status, attempts, task_url)
+
+        time.sleep(random.uniform(0.5, 1.5) * interval)
+        interval = min(max_interval, interval * backoff_base)
 
 
 def extract_task_output_text(task: Dict[str, Any]) -> List[str]:
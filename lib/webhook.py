@@ -0,0 +1,157 @@
+"""
+Webhook registration and event-driven task waiting for Manus API.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, Any
+
+from .session import get_session, json_headers, bare_headers, json_loads, json_dumps
+from .task import get_task_status, poll_task_until_complete
+
+
+# Endpoint path templates, precomputed once at module load
+_WEBHOOKS_URL_TMPL = "{}/webhooks"
+_WEBHOOK_URL_TMPL = "{}/webhooks/{}"
+
+
+__all__ = [
+    "register_webhook",
+    "delete_webhook",
+    "wait_for_task_via_webhook",
+]
+
+
+def register_webhook(
+    api_key: str,
+    webhook_url: str,
+    base_url: str = "https://api.manus.ai/v1"
+) -> str:
+    """
+    Register a webhook URL with the Manus API.
+
+    Args:
+        api_key: The Manus API key
+        webhook_url: The public URL Manus should POST events to
+        base_url: The base URL for the Manus API
+
+    Returns:
+        str: The webhook_id of the registered webhook
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    response = get_session().post(
+        _WEBHOOKS_URL_TMPL.format(base_url),
+        headers=json_headers(api_key),
+        data=json_dumps({"webhook": {"url": webhook_url}})
+    )
+    response.raise_for_status()
+
+    return json_loads(response.content)["webhook_id"]
+
+
+def delete_webhook(
+    api_key: str,
+    webhook_id: str,
+    base_url: str = "https://api.manus.ai/v1"
+) -> None:
+    """
+    Delete a previously registered webhook.
+
+    Args:
+        api_key: The Manus API key
+        webhook_id: The webhook ID returned by register_webhook
+        base_url: The base URL for the Manus API
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    response = get_session().delete(
+        _WEBHOOK_URL_TMPL.format(base_url, webhook_id),
+        headers=bare_headers(api_key)
+    )
+    response.raise_for_status()
+
+
+def wait_for_task_via_webhook(
+    api_key: str,
+    task_id: str,
+    public_url: Optional[str] = None,
+    port: int = 8000,
+    timeout: Optional[float] = None,
+    base_url: str = "https://api.manus.ai/v1"
+) -> Dict[str, Any]:
+    """
+    Wait for a task to finish using a webhook instead of polling.
+
+    Spins up a local HTTP server, registers public_url as a webhook with
+    Manus, and blocks until a "task_stopped" event for task_id arrives.
+    Compared to polling, this makes O(1) API requests per task and returns
+    almost immediately after the task completes.
+
+    The local server listens on 0.0.0.0:port; public_url must be a URL
+    that routes to it (e.g. an ngrok or Modal tunnel). If public_url is
+    not provided, or no event arrives before timeout, this falls back to
+    poll_task_until_complete.
+
+    Args:
+        api_key: The Manus API key
+        task_id: The task ID to wait for
+        public_url: Publicly reachable URL forwarding to the local server
+        port: Local port to listen on (default: 8000)
+        timeout: Max seconds to wait for the webhook before falling back
+                 to polling (None to wait indefinitely)
+        base_url: The base URL for the Manus API
+
+    Returns:
+        dict: The final task object after completion
+
+    Raises:
+        requests.exceptions.HTTPError: If the API request fails
+    """
+    if not public_url:
+        # No public URL available - polling is the only option
+        return poll_task_until_complete(api_key, task_id, base_url)
+
+    task_stopped = threading.Event()
+
+    class _WebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            try:
+                payload = json.loads(self.rfile.read(length))
+            except (ValueError, TypeError):
+                payload = {}
+
+            event_type = payload.get("event_type")
+            event_task_id = payload.get("task_detail", {}).get("task_id")
+
+            if event_type == "task_stopped" and event_task_id == task_id:
+                task_stopped.set()
+
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'{"status": "received"}')
+
+        def log_message(self, format, *args):
+            # Keep the wait quiet - the caller only cares about the event
+            pass
+
+    server = ThreadingHTTPServer(("0.0.0.0", port), _WebhookHandler)
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+
+    webhook_id = register_webhook(api_key, public_url, base_url)
+
+    try:
+        if task_stopped.wait(timeout=timeout):
+            return get_task_status(api_key, task_id, base_url)
+
+        # Webhook never arrived - fall back to polling
+        return poll_task_until_complete(api_key, task_id, base_url)
+    finally:
+        delete_webhook(api_key, webhook_id, base_url)
+        server.shutdown()
+        server.server_close()
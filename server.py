@@ -1,3 +1,10 @@
+import collections
+import queue
+import threading
+import time
+from typing import Union
+
+import fastapi
 import modal
 import os
 import requests
@@ -9,13 +16,49 @@ image = modal.Image.debian_slim().pip_install("fastapi[standard]", "requests")
 # Define the secret we created
 manus_secret = modal.Secret.from_name("manus-api-key")
 
-@app.function(image=image, secrets=[manus_secret])
-@modal.fastapi_endpoint(method="POST")
-def handle_webhook(payload: dict):
+# Flight recorder of recent events: bounded so memory stays constant no
+# matter how long the container lives - the oldest entry is overwritten
+# once the buffer is full. Entries are (epoch_seconds, payload) - the
+# timestamp is a cheap float; format it only when displaying, never on
+# the receive path
+received_events = collections.deque(maxlen=10_000)
+
+# Handoff queue between the HTTP handler and the dispatch worker: the
+# endpoint ACKs as soon as the event is enqueued, so the sender is never
+# blocked on our downstream work
+event_queue = queue.Queue(maxsize=100_000)
+
+_worker_lock = threading.Lock()
+_worker = None
+
+
+def _drain_events():
+    """Worker loop: pull events off the queue and dispatch them."""
+    while True:
+        event = event_queue.get()
+        try:
+            process_event(event)
+        except Exception as e:
+            # A bad event or a network blip must not kill the worker:
+            # everything behind it in the queue would sit unprocessed
+            # while the endpoint kept ACKing. Log and move on.
+            print(f"❌ Error processing event: {e!r}")
+
+
+def _ensure_worker():
+    """Start the dispatch worker thread, restarting it if it ever died."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_drain_events, daemon=True)
+            _worker.start()
+
+def process_event(payload: dict) -> dict:
     """
-    Receives webhook events, and if a task has stopped, fetches its full details.
+    Processes a single webhook event, and if a task has stopped, fetches its full details.
     """
     event_type = payload.get("event_type")
+    received_events.append((time.time(), payload))
     print(f"🔔 Received event: {event_type}")
 
     # Check if the task has finished
@@ -42,4 +85,51 @@ def handle_webhook(payload: dict):
             else:
                 print(f"❌ Error fetching task details: {response.status_code}")
 
-    return {"status": "received"}
\ No newline at end of file
+    return {"status": "received"}
+
+
+@app.function(image=image, secrets=[manus_secret])
+@modal.concurrent(max_inputs=100)
+@modal.fastapi_endpoint(method="POST")
+def handle_webhook(payload: Union[dict, list]):
+    """
+    Receives webhook events, singly or as a batch, and ACKs immediately.
+
+    A JSON object is treated as one event; a JSON array is treated as a
+    batch, so bursty senders can amortize one request over many events.
+    Events are pushed onto an in-process queue and processed by a
+    background worker, keeping ACK latency independent of downstream
+    work.
+
+    Each event is accepted or rejected individually, and the batch
+    response echoes every event's event_id with its status - so when the
+    queue fills mid-batch, the sender resends only the rejected events
+    instead of replaying ones we already accepted. A single event that
+    cannot be queued answers 503 so the sender retries later.
+    """
+    _ensure_worker()
+
+    events = payload if isinstance(payload, list) else [payload]
+
+    results = []
+    for event in events:
+        # Only JSON objects are processable events; reject anything else
+        # at the door instead of queueing it for the worker to choke on
+        if not isinstance(event, dict):
+            results.append({"event_id": None, "status": "rejected"})
+            continue
+        event_id = event.get("event_id")
+        try:
+            event_queue.put_nowait(event)
+        except queue.Full:
+            results.append({"event_id": event_id, "status": "rejected"})
+        else:
+            results.append({"event_id": event_id, "status": "accepted"})
+
+    if isinstance(payload, list):
+        return results
+
+    if results[0]["status"] == "rejected":
+        raise fastapi.HTTPException(status_code=503, detail="Event queue is full")
+
+    return results[0]
\ No newline at end of file
@@ -1,9 +1,12 @@
+import collections
 import modal
 import os
 import requests
 import json
 import fastapi
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from slack_sdk.signature import SignatureVerifier
 from slack_sdk.web.client import WebClient
 from slack_sdk.web.slack_response import SlackResponse
@@ -14,11 +17,23 @@ from typing import TypedDict, Optional
 # --- Modal App Setup ---
 app = modal.App("slack-manus-bridge")
 image = modal.Image.debian_slim().pip_install(
-    "fastapi[standard]", "requests", "slack-sdk"
+    "fastapi[standard]", "requests", "slack-sdk", "orjson"
 )
 
 FileID = str
 
+# orjson parses webhook bodies several times faster than stdlib json,
+# which matters since parsing is most of the work this app does per
+# request; fall back silently when it is not installed
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _json_loads(data):
+        return json.loads(data)
+
 
 @dataclass
 class SlackFileAttachment:
@@ -33,6 +48,35 @@ class FileIDAttachment(TypedDict):
     filename: str
 
 
+# One pooled session for every outbound HTTP call (Manus API, presigned
+# uploads, Slack file downloads) so repeated calls reuse keep-alive
+# connections instead of paying a TCP+TLS handshake each time
+http = requests.Session()
+_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=32)
+http.mount("https://", _adapter)
+http.mount("http://", _adapter)
+
+# Bounded LRU of recently seen Manus event IDs: retried deliveries of
+# an already-processed event are ACKed without redoing downstream work
+_seen_event_ids = collections.OrderedDict()
+_seen_event_ids_lock = threading.Lock()
+_SEEN_EVENT_IDS_MAX = 100_000
+
+
+def _is_duplicate_event(event_id) -> bool:
+    """Record event_id and report whether it was already seen."""
+    if event_id is None:
+        return False
+    with _seen_event_ids_lock:
+        if event_id in _seen_event_ids:
+            _seen_event_ids.move_to_end(event_id)
+            return True
+        _seen_event_ids[event_id] = None
+        if len(_seen_event_ids) > _SEEN_EVENT_IDS_MAX:
+            _seen_event_ids.popitem(last=False)
+    return False
+
+
 slack_secret = modal.Secret.from_name("slack-credentials")
 manus_secret = modal.Secret.from_name("manus-api-key")
 
@@ -49,16 +93,21 @@ class AppMentionEvent(TypedDict):
     user: str
     files: list[dict]
 
-def upload_file_to_manus(file_content: bytes, filename: str) -> str:
+def upload_file_to_manus(file_content, filename: str, content_length: Optional[str] = None) -> str:
     """
     Uploads a file to the Manus workspace and returns its file_id.
+
+    file_content may be raw bytes or a file-like object; file-likes are
+    streamed to the presigned URL in chunks, so large files never sit
+    fully in memory. Pass content_length when it is known (e.g. from the
+    source response headers) to avoid chunked transfer encoding.
     """
     api_key = os.environ["MANUS_API_KEY"]
     base_url = "https://api.manus.ai/v1"
 
     # Step 1: Create a file record and get a presigned upload URL
     headers = {"API_KEY": api_key, "Content-Type": "application/json"}
-    create_file_response = requests.post(
+    create_file_response = http.post(
         f"{base_url}/files",
         headers=headers,
         json={"filename": filename}
@@ -71,10 +120,18 @@ def upload_file_to_manus(file_content: bytes, filename: str) -> str:
     print(f"✓ File record created for '{filename}'. File ID: {file_id}")
 
     # Step 2: Upload the file content to the presigned URL
-    upload_response = requests.put(
+    upload_headers = {"Content-Type": "application/octet-stream"} # Use octet-stream for raw bytes
+    if content_length is not None and not isinstance(file_content, (bytes, bytearray)):
+        # Expose the stream's size where requests looks for it, so it
+        # sends a Content-Length and skips chunked transfer encoding -
+        # setting the header by hand would leave both framing headers on
+        # the request, which presigned endpoints reject
+        file_content.len = int(content_length)
+
+    upload_response = http.put(
         upload_url,
-        data=file_content,
-        headers={"Content-Type": "application/octet-stream"} # Use octet-stream for raw bytes
+        data=file_content, # bytes or a file-like object to stream
+        headers=upload_headers
     )
     upload_response.raise_for_status()
     
@@ -160,7 +217,7 @@ def upload_files(channel: str, files: list[SlackFileAttachment], thread_ts: str)
         response: SlackResponse = client.files_upload_v2(
             channel=channel,
             filename=file.filename,
-            content=requests.get(file.url).content,
+            content=http.get(file.url).content,
             thread_ts=thread_ts,
         )
         if not response.get("ok"):
@@ -230,7 +287,7 @@ Respond helpfully and accurately, following the steps above.
     if attachments:
         payload["attachments"] = attachments
 
-    response = requests.post(
+    response = http.post(
         f"{base_url}/tasks",
         headers={"API_KEY": api_key},
         json=payload,
@@ -258,7 +315,7 @@ def handle_manus_response(payload: dict) -> None:
     # 2. Fetch the full task details from the Manus API
     api_key = os.environ["MANUS_API_KEY"]
     base_url = "https://api.manus.ai/v1"
-    response = requests.get(f"{base_url}/tasks/{task_id}", headers={"API_KEY": api_key})
+    response = http.get(f"{base_url}/tasks/{task_id}", headers={"API_KEY": api_key})
     full_task = response.json()
 
     # 3. Find the last user message and post all subsequent assistant messages
@@ -283,12 +340,14 @@ def handle_manus_response(payload: dict) -> None:
         attachments = []
         
         for content in message.get("content", []):
-            if content.get("type") == "output_text":
+            # Look each field up once per content item
+            content_type = content.get("type")
+            if content_type == "output_text":
                 raw_text = content.get("text")
                 text_content = convert_to_slack_mrkdwn(raw_text)
                 # Convert the raw markdown into rich blocks
                 message_blocks = markdown_to_slack_blocks(raw_text)
-            elif content.get("type") == "output_file":
+            elif content_type == "output_file":
                 attachments.append(
                     SlackFileAttachment(
                         filename=content.get("fileName"), url=content.get("fileUrl")
@@ -327,25 +386,51 @@ def handle_slack_message(event: AppMentionEvent) -> None:
     manus_attachments: list[FileIDAttachment] = []
     if "files" in event:
         print(f"Found {len(event['files'])} files in the Slack message.")
-        for file in event["files"]:
+
+        def ingest_file(file: dict) -> FileIDAttachment:
             file_url = file["url_private_download"]
             file_name = file["name"]
-            
-            # Download the file using the authenticated Slack URL
-            response = requests.get(
+
+            # Download the file using the authenticated Slack URL,
+            # streaming so it is piped into the Manus upload instead of
+            # being materialized in memory first
+            response = http.get(
                 file_url,
-                headers={"Authorization": f"Bearer {os.environ['SLACK_BOT_TOKEN']}"}
+                headers={"Authorization": f"Bearer {os.environ['SLACK_BOT_TOKEN']}"},
+                stream=True
             )
             response.raise_for_status()
-            
+
+            # Decode any transport compression as we read, so the bytes
+            # we forward are the file itself, not Slack's gzipped wire
+            # format
+            response.raw.decode_content = True
+
+            # Content-Length describes the wire bytes, so it only matches
+            # the decoded stream when the response was not compressed;
+            # otherwise let requests fall back to chunked framing
+            if response.headers.get("Content-Encoding"):
+                content_length = None
+            else:
+                content_length = response.headers.get("Content-Length")
+
             # Upload the file to Manus and get the file_id
-            file_id = upload_file_to_manus(response.content, file_name)
-            
+            file_id = upload_file_to_manus(
+                response.raw,
+                file_name,
+                content_length=content_length
+            )
+
             # Prepare the attachment for the Manus task
-            manus_attachments.append({
+            return {
                 "file_id": file_id,
                 "filename": file_name,
-            })
+            }
+
+        # Each attachment is an independent download + upload, so run
+        # them concurrently instead of one after another
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            manus_attachments = list(executor.map(ingest_file, event["files"]))
     
     if existing_task_id:
         # --- This is a follow-up message ---
@@ -418,10 +503,24 @@ def fastapi_app():
         request: fastapi.Request, background_tasks: fastapi.BackgroundTasks
     ):
         """Handles all incoming webhook events from Manus."""
-        payload = await request.json()
+        # Malformed JSON, or a body that is not a JSON object, is a
+        # permanent client error: answer 400 so the sender does not
+        # retry an unprocessable delivery forever
+        try:
+            payload = _json_loads(await request.body())
+        except ValueError:
+            return fastapi.Response(status_code=400)
+        if not isinstance(payload, dict):
+            return fastapi.Response(status_code=400)
+
+        # Retried deliveries of an event we already handled are ACKed
+        # immediately so duplicate work is never queued
+        if _is_duplicate_event(payload.get("event_id")):
+            return {"status": "ok", "duplicate": True}
+
         print("Received Manus Event:")
         print(json.dumps(payload, indent=2))
-        
+
         background_tasks.add_task(handle_manus_response, payload)
         return {"status": "ok"}
 
@@ -442,16 +541,24 @@ def fastapi_app():
             print("✗ Invalid request signature. Potential security breach!")
             return fastapi.Response(status_code=403)
 
-        # 3. Parse the JSON payload
-        payload = json.loads(body)
+        # 3. Parse the JSON payload; malformed or non-object bodies get
+        # a 400, not a retryable server error
+        try:
+            payload = _json_loads(body)
+        except ValueError:
+            return fastapi.Response(status_code=400)
+        if not isinstance(payload, dict):
+            return fastapi.Response(status_code=400)
         print(json.dumps(payload, indent=2))  # Pretty print the payload for debugging
 
         # 4. Handle Slack's one-time URL verification challenge
-        if payload.get("type") == "url_verification":
+        payload_type = payload.get("type")
+        if payload_type == "url_verification":
             return {"challenge": payload.get("challenge")}
 
-        if payload.get("type") == "event_callback" and payload.get("event").get("type") == "app_mention":
-            background_tasks.add_task(handle_slack_message, payload.get("event"))
+        event = payload.get("event") or {}
+        if payload_type == "event_callback" and event.get("type") == "app_mention":
+            background_tasks.add_task(handle_slack_message, event)
 
         # 5. Acknowledge all other events for now
         return {"status": "ok"}